@@ -0,0 +1,147 @@
+"""
+Async Polymarket Gamma API client — same surface as GammaClient, but
+non-blocking and over HTTP/2, so a scan's /markets + K /prices-history
+calls are multiplexed on one connection instead of queued.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+import httpx
+
+from .gamma_client import (
+    CACHE_SIZE,
+    CACHE_TTL,
+    GAMMA_BASE,
+    PRICE_HISTORY_TTL,
+    RETRY_BACKOFF,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    CacheEntry,
+    Market,
+    ResponseCache,
+    cache_key,
+    load_key,
+    parse_market,
+    parse_markets,
+)
+
+
+class AsyncGammaClient:
+    def __init__(
+        self,
+        base_url: str = GAMMA_BASE,
+        cache_ttl: float = CACHE_TTL,
+        cache_size: int = CACHE_SIZE,
+    ):
+        self.base = base_url
+        self.cache_ttl = cache_ttl
+        self._cache = ResponseCache(cache_size)
+        self.http = httpx.AsyncClient(
+            base_url=base_url,
+            # Connection-level failures are retried by the transport;
+            # transient statuses are retried in _request below.
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                retries=RETRY_TOTAL,
+            ),
+            headers={
+                "User-Agent": "polly-agent/0.1",
+                "Accept-Encoding": "gzip, br, deflate",
+            },
+            timeout=15,
+        )
+
+    async def __aenter__(self) -> "AsyncGammaClient":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def _request(self, path: str, params: dict = None, headers: dict = None) -> httpx.Response:
+        """GET with the same status retries/backoff as GammaClient's adapter."""
+        for attempt in range(RETRY_TOTAL + 1):
+            r = await self.http.get(path, params=params, headers=headers)
+            if r.status_code not in RETRY_STATUSES or attempt == RETRY_TOTAL:
+                return r
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+    async def _get(
+        self,
+        path: str,
+        params: dict = None,
+        ttl: float = None,
+        parse: Callable[[bytes], Any] = None,
+    ) -> Any:
+        """Async GammaClient._get: same TTL cache and conditional revalidation."""
+        ttl = self.cache_ttl if ttl is None else ttl
+        key = cache_key(path, params)
+        cached = self._cache.get(key) if ttl > 0 else None
+        if cached and cached.fresh:
+            return cached.body
+
+        r = await self._request(path, params, cached.validators() if cached else None)
+        if cached and r.status_code == 304:
+            self._cache[key] = cached._replace(expires_at=time.monotonic() + ttl)
+            return cached.body
+        r.raise_for_status()
+        body = parse(r.content) if parse else r.json()
+
+        if ttl > 0:
+            self._cache[key] = CacheEntry(
+                r.headers.get("ETag"),
+                r.headers.get("Last-Modified"),
+                body,
+                time.monotonic() + ttl,
+            )
+        return body
+
+    async def get_active_markets(
+        self,
+        limit: int = 100,
+        min_volume: float = 10_000,
+        min_liquidity: float = 1_000,
+        top_n: Optional[int] = None,
+    ) -> list[Market]:
+        """Fetch active, liquid markets sorted by 24hr volume."""
+        data = await self._get("/markets", params={
+            "limit": limit,
+            "active": "true",
+            "closed": "false",
+        })
+        return parse_markets(data, min_volume, min_liquidity, top_n)
+
+    async def get_market_by_slug(self, slug: str) -> Optional[Market]:
+        data = await self._get("/markets", params={"slug": slug})
+        if not data:
+            return None
+        m = data[0] if isinstance(data, list) else data
+        return parse_market(m)
+
+    async def get_price_history(self, market_id: str, interval: str = "1d") -> list[dict]:
+        """Get historical price data for a market."""
+        try:
+            return await self._get(f"/markets/{market_id}/prices-history",
+                                   params={"interval": interval},
+                                   ttl=PRICE_HISTORY_TTL,
+                                   parse=lambda b: load_key(b, "history", []))
+        except Exception:
+            return []
+
+    async def get_price_histories(
+        self, market_ids: list[str], interval: str = "1d"
+    ) -> dict[str, list[dict]]:
+        """Fetch price history for many markets concurrently."""
+        histories = await asyncio.gather(
+            *[self.get_price_history(mid, interval) for mid in market_ids]
+        )
+        return dict(zip(market_ids, histories))
+
+    async def get_top_markets(self, n: int = 20) -> list[Market]:
+        """Get top N markets by 24hr volume."""
+        return await self.get_active_markets(limit=200, top_n=n)
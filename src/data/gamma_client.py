@@ -3,16 +3,143 @@ Polymarket Gamma API client — public, no auth required.
 Handles market/event discovery and historical data.
 """
 
-import json
+import heapq
+import threading
+import time
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same loads() signature for str input
+    import json as orjson
+
+try:
+    import ijson  # incremental parser — rows are built one at a time off the socket
+except ImportError:
+    ijson = None
+
+try:
+    import simdjson  # pysimdjson — On-Demand parsing, only touched keys are built
+except ImportError:
+    simdjson = None
 
 GAMMA_BASE = "https://gamma-api.polymarket.com"
 CLOB_BASE  = "https://clob.polymarket.com"
 
+POOL_SIZE = 32
+CACHE_TTL = 60            # seconds a cached GET is served without revalidating
+CACHE_SIZE = 1024         # cached GETs kept per client, least recently used evicted first
+PRICE_HISTORY_TTL = 300
+
+# Transient statuses retried with exponential backoff, by both clients
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.2
+
+# Fields every /markets row must carry; fetched in one C-level call per row.
+_REQUIRED = itemgetter("id", "question", "slug", "conditionId", "volumeNum", "liquidityNum")
+
+# simdjson parsers are reusable but not thread-safe — one per thread.
+_local = threading.local()
+
+
+class CacheEntry(NamedTuple):
+    """One cached GET: its validators, parsed body and expiry (monotonic)."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Any
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def validators(self) -> dict:
+        """Conditional-request headers for revalidating a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(path: str, params: Optional[dict]) -> tuple:
+    return path, frozenset((params or {}).items())
 
-@dataclass
+
+class ResponseCache:
+    """
+    Bounded LRU of CacheEntry per (path, params), shared by both clients.
+    Expired entries are kept for revalidation only if they carry an ETag or
+    Last-Modified; ones that can never be revalidated are dropped on lookup.
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        # GammaClient.get_price_histories hits the cache from worker threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if not entry.fresh and not (entry.etag or entry.last_modified):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def __setitem__(self, key: tuple, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def load_key(content: bytes, key: str, default: Any = None) -> Any:
+    """
+    Decode a single top-level key from a JSON object payload.
+    With simdjson the rest of the document is never materialized;
+    otherwise falls back to a full orjson/json parse.
+    """
+    if simdjson is None:
+        return orjson.loads(content).get(key, default)
+    parser = getattr(_local, "parser", None)
+    if parser is None:
+        parser = _local.parser = simdjson.Parser()
+    value = parser.parse(content).get(key)
+    if value is None:
+        return default
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    return value
+
+
+def _yes_no(prices: list[float]) -> tuple[float, float]:
+    """(yes, no) prices from outcome_prices, 0.5 for any missing side."""
+    return (
+        prices[0] if prices else 0.5,
+        prices[1] if len(prices) > 1 else 0.5,
+    )
+
+
+@dataclass(slots=True)
 class Market:
     id: str
     question: str
@@ -30,14 +157,53 @@ class Market:
     neg_risk: bool
     description: str = ""
     tags: list[str] = field(default_factory=list)
+    # Derived from outcome_prices once at construction, read as plain fields
+    yes_price: float = field(init=False, default=0.5)
+    no_price: float = field(init=False, default=0.5)
 
-    @property
-    def yes_price(self) -> float:
-        return self.outcome_prices[0] if self.outcome_prices else 0.5
+    def __post_init__(self):
+        self.yes_price, self.no_price = _yes_no(self.outcome_prices)
 
-    @property
-    def no_price(self) -> float:
-        return self.outcome_prices[1] if len(self.outcome_prices) > 1 else 0.5
+    @classmethod
+    def from_raw(
+        cls,
+        m: dict,
+        mid: str,
+        question: str,
+        slug: str,
+        condition_id: str,
+        vol: float,
+        liq: float,
+        prices: list[float],
+        outcomes: list[str],
+        tokens: list[str],
+    ) -> "Market":
+        """
+        Build from a raw /markets row plus its already-extracted fields
+        (the _REQUIRED values and decoded arrays); only the optional
+        fields are read from m. Fills the slots directly, skipping the
+        keyword __init__ — keep in sync with the field list above.
+        """
+        self = object.__new__(cls)
+        get = m.get
+        self.id = mid
+        self.question = question
+        self.slug = slug
+        self.condition_id = condition_id
+        self.clob_token_ids = tokens
+        self.outcome_prices = prices
+        self.outcomes = outcomes
+        self.volume = vol
+        self.volume_24hr = float(get("volume24hr", 0))
+        self.liquidity = liq
+        self.end_date = get("endDateIso", "")
+        self.active = get("active", False)
+        self.accepting_orders = get("acceptingOrders", False)
+        self.neg_risk = get("negRisk", False)
+        self.description = get("description", "")
+        self.tags = []
+        self.yes_price, self.no_price = _yes_no(prices)
+        return self
 
     @property
     def implied_yes_prob(self) -> float:
@@ -45,22 +211,157 @@ class Market:
         return self.yes_price
 
 
+def iter_markets(
+    rows: Iterable[dict],
+    min_volume: float = 10_000,
+    min_liquidity: float = 1_000,
+) -> Iterator[Market]:
+    """Filter raw /markets rows and yield Markets, in input order."""
+    # Bind hot callables to locals: LOAD_FAST instead of LOAD_GLOBAL/LOAD_ATTR per row
+    _loads = orjson.loads
+    _float = float
+    for m in rows:
+        try:
+            get = m.get
+            # Cheap scalar filters first — only surviving rows pay for
+            # decoding the stringified JSON arrays below.
+            if not get("enableOrderBook"):
+                continue
+            mid, question, slug, condition_id, vol_raw, liq_raw = _REQUIRED(m)
+            vol = _float(vol_raw)
+            liq = _float(liq_raw)
+            if vol < min_volume or liq < min_liquidity:
+                continue
+
+            # The three stringified arrays are decoded in a single loads call
+            prices_raw, outcomes, tokens = _loads(
+                f'[{get("outcomePrices", "[]")},'
+                f'{get("outcomes", "[]")},'
+                f'{get("clobTokenIds", "[]")}]'
+            )
+            prices = [_float(p) for p in prices_raw]
+
+            market = Market.from_raw(m, mid, question, slug, condition_id,
+                                     vol, liq, prices, outcomes, tokens)
+        except Exception as e:
+            # Skip malformed entries
+            continue
+        yield market
+
+
+def parse_markets(
+    data: Iterable[dict],
+    min_volume: float = 10_000,
+    min_liquidity: float = 1_000,
+    top_n: Optional[int] = None,
+) -> list[Market]:
+    """
+    Filter raw /markets rows and build Markets, sorted by 24hr volume.
+    If top_n is given, only the top_n highest-volume markets are returned.
+    """
+    markets = iter_markets(data, min_volume, min_liquidity)
+    # Sort by 24hr volume descending — partial heap selection when only
+    # the head of the list is wanted
+    key = attrgetter("volume_24hr")
+    if top_n is not None:
+        return heapq.nlargest(top_n, markets, key=key)
+    return sorted(markets, key=key, reverse=True)
+
+
+def parse_market(m: dict) -> Market:
+    """Build a Market from one raw /markets row, without filtering."""
+    prices = [float(p) for p in orjson.loads(m.get("outcomePrices", "[]"))]
+    outcomes = orjson.loads(m.get("outcomes", "[]"))
+    tokens = orjson.loads(m.get("clobTokenIds", "[]"))
+    return Market.from_raw(
+        m,
+        m["id"],
+        m["question"],
+        m["slug"],
+        m["conditionId"],
+        float(m.get("volumeNum", 0)),
+        float(m.get("liquidityNum", 0)),
+        prices,
+        outcomes,
+        tokens,
+    )
+
+
 class GammaClient:
-    def __init__(self, base_url: str = GAMMA_BASE):
+    def __init__(
+        self,
+        base_url: str = GAMMA_BASE,
+        cache_ttl: float = CACHE_TTL,
+        cache_size: int = CACHE_SIZE,
+    ):
         self.base = base_url
+        self.cache_ttl = cache_ttl
+        self._cache = ResponseCache(cache_size)
         self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "polly-agent/0.1"})
+        # Larger keep-alive pool + retries on transient errors, so repeated
+        # /markets and /prices-history calls reuse the same TCP+TLS connections.
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "User-Agent": "polly-agent/0.1",
+            "Connection": "keep-alive",
+            # /markets is number-heavy JSON and compresses ~3x; urllib3
+            # decodes br transparently when the brotli package is present.
+            "Accept-Encoding": "gzip, br, deflate",
+        })
+
+    def _get(
+        self,
+        path: str,
+        params: dict = None,
+        ttl: float = None,
+        parse: Callable[[bytes], Any] = None,
+    ) -> Any:
+        """
+        GET + parse JSON, cached per (path, params).
+        Fresh entries are returned without a request; stale ones are
+        revalidated with If-None-Match / If-Modified-Since and reused on 304.
+        ttl overrides cache_ttl for this call (0 disables caching).
+        parse, if given, replaces the full JSON decode of the response body.
+        """
+        ttl = self.cache_ttl if ttl is None else ttl
+        key = cache_key(path, params)
+        cached = self._cache.get(key) if ttl > 0 else None
+        if cached and cached.fresh:
+            return cached.body
 
-    def _get(self, path: str, params: dict = None) -> dict | list:
-        r = self.session.get(f"{self.base}{path}", params=params, timeout=15)
+        r = self.session.get(f"{self.base}{path}", params=params,
+                             headers=cached.validators() if cached else None,
+                             timeout=15)
+        if cached and r.status_code == 304:
+            self._cache[key] = cached._replace(expires_at=time.monotonic() + ttl)
+            return cached.body
         r.raise_for_status()
-        return r.json()
+        body = parse(r.content) if parse else r.json()
+
+        if ttl > 0:
+            self._cache[key] = CacheEntry(
+                r.headers.get("ETag"),
+                r.headers.get("Last-Modified"),
+                body,
+                time.monotonic() + ttl,
+            )
+        return body
 
     def get_active_markets(
         self,
         limit: int = 100,
         min_volume: float = 10_000,
         min_liquidity: float = 1_000,
+        top_n: Optional[int] = None,
     ) -> list[Market]:
         """Fetch active, liquid markets sorted by 24hr volume."""
         data = self._get("/markets", params={
@@ -69,85 +370,79 @@ class GammaClient:
             "closed": "false",
         })
 
-        markets = []
-        for m in data:
-            try:
-                vol = float(m.get("volumeNum", 0))
-                liq = float(m.get("liquidityNum", 0))
-                if vol < min_volume or liq < min_liquidity:
-                    continue
-                if not m.get("enableOrderBook"):
-                    continue
-
-                prices_raw = m.get("outcomePrices", "[]")
-                prices = [float(p) for p in json.loads(prices_raw)]
-
-                outcomes_raw = m.get("outcomes", "[]")
-                outcomes = json.loads(outcomes_raw)
-
-                tokens_raw = m.get("clobTokenIds", "[]")
-                tokens = json.loads(tokens_raw)
-
-                markets.append(Market(
-                    id=m["id"],
-                    question=m["question"],
-                    slug=m["slug"],
-                    condition_id=m["conditionId"],
-                    clob_token_ids=tokens,
-                    outcome_prices=prices,
-                    outcomes=outcomes,
-                    volume=vol,
-                    volume_24hr=float(m.get("volume24hr", 0)),
-                    liquidity=liq,
-                    end_date=m.get("endDateIso", ""),
-                    active=m.get("active", False),
-                    accepting_orders=m.get("acceptingOrders", False),
-                    neg_risk=m.get("negRisk", False),
-                    description=m.get("description", ""),
-                ))
-            except Exception as e:
-                # Skip malformed entries
-                continue
+        return parse_markets(data, min_volume, min_liquidity, top_n)
 
-        # Sort by 24hr volume descending
-        markets.sort(key=lambda m: m.volume_24hr, reverse=True)
-        return markets
+    def iter_active_markets(
+        self,
+        limit: int = 100,
+        min_volume: float = 10_000,
+        min_liquidity: float = 1_000,
+    ) -> Iterator[Market]:
+        """
+        Yield active, liquid markets one at a time (unsorted), for low-memory scans.
+        A fresh cached /markets body is reused when there is one. Otherwise
+        the response is streamed through ijson, so rejected rows never sit in
+        memory alongside the rest of the payload. Either way the result is
+        not written back to the cache — streaming would have to keep every
+        row to do so. Without ijson the body is fetched whole, also uncached.
+        """
+        params = {"limit": limit, "active": "true", "closed": "false"}
+        cached = self._cache.get(cache_key("/markets", params))
+        if cached and cached.fresh:
+            yield from iter_markets(cached.body, min_volume, min_liquidity)
+            return
+        if ijson is None:
+            yield from iter_markets(self._get("/markets", params=params, ttl=0),
+                                    min_volume, min_liquidity)
+            return
+        with self.session.get(f"{self.base}/markets", params=params,
+                              stream=True, timeout=15) as r:
+            r.raise_for_status()
+            r.raw.decode_content = True  # undo gzip/br before ijson sees it
+            rows = ijson.items(r.raw, "item", use_float=True)
+            yield from iter_markets(rows, min_volume, min_liquidity)
 
     def get_market_by_slug(self, slug: str) -> Optional[Market]:
         data = self._get("/markets", params={"slug": slug})
         if not data:
             return None
         m = data[0] if isinstance(data, list) else data
-        prices = [float(p) for p in json.loads(m.get("outcomePrices", "[]"))]
-        outcomes = json.loads(m.get("outcomes", "[]"))
-        tokens = json.loads(m.get("clobTokenIds", "[]"))
-        return Market(
-            id=m["id"],
-            question=m["question"],
-            slug=m["slug"],
-            condition_id=m["conditionId"],
-            clob_token_ids=tokens,
-            outcome_prices=prices,
-            outcomes=outcomes,
-            volume=float(m.get("volumeNum", 0)),
-            volume_24hr=float(m.get("volume24hr", 0)),
-            liquidity=float(m.get("liquidityNum", 0)),
-            end_date=m.get("endDateIso", ""),
-            active=m.get("active", False),
-            accepting_orders=m.get("acceptingOrders", False),
-            neg_risk=m.get("negRisk", False),
-            description=m.get("description", ""),
-        )
+        return parse_market(m)
 
     def get_price_history(self, market_id: str, interval: str = "1d") -> list[dict]:
         """Get historical price data for a market."""
         try:
-            data = self._get(f"/markets/{market_id}/prices-history",
-                             params={"interval": interval})
-            return data.get("history", [])
+            return self._get(f"/markets/{market_id}/prices-history",
+                             params={"interval": interval},
+                             ttl=PRICE_HISTORY_TTL,
+                             parse=lambda b: load_key(b, "history", []))
         except Exception:
             return []
 
-    def get_top_markets(self, n: int = 20) -> list[Market]:
-        """Get top N markets by 24hr volume."""
-        return self.get_active_markets(limit=200)[:n]
+    def get_price_histories(
+        self,
+        market_ids: list[str],
+        interval: str = "1d",
+        max_workers: int = 16,
+    ) -> dict[str, list[dict]]:
+        """Fetch price history for many markets concurrently over the shared pool."""
+        if not market_ids:
+            return {}
+        workers = min(max_workers, len(market_ids))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            histories = pool.map(
+                lambda mid: self.get_price_history(mid, interval), market_ids
+            )
+            return dict(zip(market_ids, histories))
+
+    def get_top_markets(self, n: int = 20, stream: bool = False) -> list[Market]:
+        """
+        Get top N markets by 24hr volume.
+        Goes through the cached /markets GET by default; stream=True trades
+        that cache for bounded memory via iter_active_markets().
+        """
+        if stream:
+            return heapq.nlargest(
+                n, self.iter_active_markets(limit=200), key=attrgetter("volume_24hr")
+            )
+        return self.get_active_markets(limit=200, top_n=n)
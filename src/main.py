@@ -8,18 +8,23 @@ Usage:
   python src/main.py market SLUG # Research one specific market
 """
 
+import asyncio
 import sys
-import time
 from datetime import datetime
 
-from data.gamma_client import GammaClient
+import httpx
+
+from data.async_gamma_client import AsyncGammaClient
+from data.gamma_client import GammaClient, Market
 
 
 def cmd_list(limit: int = 20):
     """Print top active markets by 24hr volume."""
     client = GammaClient()
-    markets = client.get_top_markets(n=limit)
+    print_markets(client.get_top_markets(n=limit))
+
 
+def print_markets(markets: list[Market]):
     print(f"\n{'─'*80}")
     print(f"{'TOP ACTIVE POLYMARKET MARKETS':^80}")
     print(f"{'by 24hr Volume':^80}")
@@ -58,6 +63,19 @@ def cmd_market(slug: str):
     print(f"\nDescription:\n{m.description[:500]}")
 
 
+async def cmd_monitor(limit: int = 30, interval: int = 30 * 60):
+    """Rescan top markets every `interval` seconds over one async client."""
+    async with AsyncGammaClient() as client:
+        while True:
+            print(f"\n[{datetime.utcnow().isoformat()}] Running scan...")
+            try:
+                print_markets(await client.get_top_markets(n=limit))
+            except httpx.HTTPError as e:
+                # Retries exhausted — skip this round, keep monitoring
+                print(f"Scan failed: {e}")
+            await asyncio.sleep(interval)
+
+
 def main():
     args = sys.argv[1:]
     cmd = args[0] if args else "list"
@@ -79,10 +97,7 @@ def main():
 
     elif cmd == "monitor":
         print("Monitor mode — scanning every 30 minutes. Ctrl+C to stop.\n")
-        while True:
-            print(f"\n[{datetime.utcnow().isoformat()}] Running scan...")
-            cmd_list(30)
-            time.sleep(30 * 60)
+        asyncio.run(cmd_monitor(30))
 
     else:
         print(__doc__)
@@ -8,16 +8,28 @@ Flow:
   4. Return a ResearchResult with confidence metadata
 """
 
+import asyncio
+import hashlib
 import json
-import subprocess
+import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
 
-from src.data.gamma_client import Market
+import httpx
+import numpy as np
 
+from src.data.gamma_client import GammaClient, Market
 
-@dataclass
+log = logging.getLogger("polly.research")
+
+RESEARCH_CACHE_TTL = 15 * 60   # seconds before a market is re-researched
+RESEARCH_CACHE_SIZE = 512      # markets kept, least recently used evicted first
+
+
+@dataclass(slots=True)
 class ResearchResult:
     market_id: str
     question: str
@@ -32,8 +44,8 @@ class ResearchResult:
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
     # Thresholds
-    MIN_EDGE = 0.08         # Minimum |polly_p - market_p| to consider betting
-    MIN_CONFIDENCE = 0.60   # Minimum confidence to pull the trigger
+    MIN_EDGE: ClassVar[float] = 0.08         # Minimum |polly_p - market_p| to consider betting
+    MIN_CONFIDENCE: ClassVar[float] = 0.60   # Minimum confidence to pull the trigger
 
     def __post_init__(self):
         self.edge = self.polly_yes_prob - self.market_yes_price
@@ -81,20 +93,118 @@ class ResearchResult:
 class Researcher:
     """
     Orchestrates research for a given market.
-    Uses web search (via openclaw/exec) to gather signal.
+    Source pages are fetched in-process over one pooled HTTP/2 client.
     """
 
     EDGE_THRESHOLD = 0.08
     CONFIDENCE_THRESHOLD = 0.60
 
-    def __init__(self):
-        pass
+    def __init__(
+        self,
+        client: Optional[GammaClient] = None,
+        cache_ttl: float = RESEARCH_CACHE_TTL,
+        cache_size: int = RESEARCH_CACHE_SIZE,
+    ):
+        self.client = client or GammaClient()
+        # LRU: market_id -> (question+description digest, result, stored_at).
+        # One entry per market, so an edited market replaces its old entry.
+        self._cache: OrderedDict[str, tuple[bytes, ResearchResult, float]] = OrderedDict()
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # Bound to an event loop, so only created inside one: held open for
+        # the body of `async with Researcher()`, else scoped per fetch_sources()
+        self.http: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def _new_http() -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            follow_redirects=True,
+            headers={"User-Agent": "polly-agent/0.1"},
+        )
+
+    async def __aenter__(self) -> "Researcher":
+        self.http = self._new_http()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+
+    @staticmethod
+    async def _fetch(http: httpx.AsyncClient, url: str) -> str:
+        """GET one source page; empty string on failure."""
+        try:
+            r = await http.get(url)
+            r.raise_for_status()
+            return r.text
+        except httpx.HTTPError:
+            return ""
+
+    async def fetch_sources(self, urls: list[str]) -> dict[str, str]:
+        """Fetch news/data pages for a market concurrently, keyed by URL."""
+        if self.http is None:
+            async with self._new_http() as http:
+                pages = await asyncio.gather(*[self._fetch(http, u) for u in urls])
+        else:
+            pages = await asyncio.gather(*[self._fetch(self.http, u) for u in urls])
+        return dict(zip(urls, pages))
+
+    def price_histories(
+        self, markets: list[Market], interval: str = "1d"
+    ) -> dict[str, list[dict]]:
+        """Price history for every market in a scan, fetched in one batch."""
+        return self.client.get_price_histories([m.id for m in markets], interval)
+
+    @staticmethod
+    def _digest(market: Market) -> bytes:
+        return hashlib.blake2b(
+            (market.question + market.description).encode(), digest_size=8
+        ).digest()
+
+    def cached_result(self, market: Market) -> Optional[ResearchResult]:
+        """
+        Prior result for this market, if still within the TTL and the
+        question/description haven't changed since it was stored.
+        Expired or drifted entries are dropped on lookup.
+        """
+        entry = self._cache.get(market.id)
+        if entry:
+            digest, result, stored_at = entry
+            if (digest == self._digest(market)
+                    and time.monotonic() - stored_at < self.cache_ttl):
+                self._cache.move_to_end(market.id)
+                self.cache_hits += 1
+                log.info(f"Research cache hit: {market.id} "
+                         f"({self.cache_hits} hits / {self.cache_misses} misses)")
+                return result
+            del self._cache[market.id]
+        self.cache_misses += 1
+        return None
+
+    def remember(self, market: Market, result: ResearchResult) -> None:
+        """Store a finished result so repolls of an unchanged market can reuse it."""
+        self._cache[market.id] = (self._digest(market), result, time.monotonic())
+        self._cache.move_to_end(market.id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     def research_market(self, market: Market) -> ResearchResult:
         """
         Full research pipeline for one market.
         Returns a ResearchResult with Polly's probability estimate.
+        A result stored via remember() is reused while it is fresh.
         """
+        cached = self.cached_result(market)
+        if cached is not None:
+            return cached
         # This will be called by the AI agent itself during a session —
         # the agent searches for news, reasons about the question,
         # and fills in polly_yes_prob + confidence + reasoning.
@@ -123,13 +233,14 @@ class Researcher:
 
     def size_bet(self, result: ResearchResult) -> float:
         """Compute Kelly-optimal bet size as % of bankroll."""
-        if not result.should_bet:
+        direction = result.bet_direction  # None unless should_bet
+        if direction is None:
             return 0.0
         p = result.polly_yes_prob
         q = 1 - p
         market_p = result.market_yes_price
 
-        if result.bet_direction == "YES":
+        if direction == "YES":
             b = (1 - market_p) / market_p  # payout per $ bet on YES
         else:
             p, q = q, p
@@ -138,3 +249,30 @@ class Researcher:
         # Scale by confidence
         raw = self.kelly_fraction(p, q, b)
         return round(raw * result.confidence, 4)
+
+    def size_bets(
+        self,
+        results: list[ResearchResult],
+        max_fraction: float = 0.05,
+    ) -> list[float]:
+        """
+        Vectorized size_bet() over a whole scan.
+        Returns one bet size (% of bankroll) per result, in input order.
+        """
+        if not results:
+            return []
+        p = np.array([r.polly_yes_prob for r in results], dtype=float)
+        mp = np.array([r.market_yes_price for r in results], dtype=float)
+        conf = np.array([r.confidence for r in results], dtype=float)
+        edge = p - mp
+        bet = (np.abs(edge) >= ResearchResult.MIN_EDGE) & (conf >= ResearchResult.MIN_CONFIDENCE)
+
+        yes_side = edge > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b = np.where(yes_side, (1 - mp) / mp, mp / (1 - mp))
+            p = np.where(yes_side, p, 1 - p)
+            kelly = (b * p - (1 - p)) / b
+        kelly = np.clip(np.nan_to_num(kelly, nan=0.0), 0.0, max_fraction)
+
+        sizes = np.where(bet, np.round(kelly * conf, 4), 0.0)
+        return sizes.tolist()
@@ -5,15 +5,28 @@ Handles authentication, order placement, and position management.
 
 import os
 import logging
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
-load_dotenv(os.path.join(os.path.dirname(__file__), "../../.env"))
-
+from eth_utils import keccak
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import ApiCreds, OrderArgs
+from py_clob_client.clob_types import (
+    ApiCreds,
+    CreateOrderOptions,
+    OrderArgs,
+    PartialCreateOrderOptions,
+)
+from py_clob_client.config import get_contract_config
+from py_clob_client.order_builder.builder import ROUNDING_CONFIG, OrderBuilder
 from py_clob_client.order_builder.constants import BUY, SELL
+from py_order_utils.builders import OrderBuilder as UtilsOrderBuilder
+from py_order_utils.model import OrderData, SignedOrder
+from py_order_utils.signer import Signer as UtilsSigner
+from py_order_utils.utils import prepend_zx
 
 log = logging.getLogger("polly.trading")
 
@@ -21,6 +34,29 @@ HOST = "https://clob.polymarket.com"
 CHAIN_ID = 137
 
 
+@dataclass(frozen=True, slots=True)
+class TraderConfig:
+    # Secrets are kept out of repr so the config can't leak via logs/tracebacks
+    private_key: str = field(repr=False)
+    api_key: Optional[str]
+    api_secret: Optional[str] = field(repr=False)
+    passphrase: Optional[str] = field(repr=False)
+    funder: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _load_config() -> TraderConfig:
+    """Read .env + environment once per process."""
+    load_dotenv(os.path.join(os.path.dirname(__file__), "../../.env"))
+    return TraderConfig(
+        private_key="0x" + os.getenv("EVM_PRIVATE_KEY", "").lstrip("0x"),
+        api_key=os.getenv("POLYMARKET_API_KEY"),
+        api_secret=os.getenv("POLYMARKET_API_SECRET"),
+        passphrase=os.getenv("POLYMARKET_API_PASSPHRASE"),
+        funder=os.getenv("EVM_WALLET_ADDRESS"),
+    )
+
+
 @dataclass
 class OrderResult:
     success: bool
@@ -33,6 +69,92 @@ class OrderResult:
     error: Optional[str] = None
 
 
+class _DomainCachedBuilder(UtilsOrderBuilder):
+    """Order signer that hashes the (immutable) EIP-712 domain once, not per order."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._domain_hash = self.domain_separator.hash_struct()
+
+    def _create_struct_hash(self, order) -> str:
+        # Same bytes as order.signable_bytes(domain=...), minus the domain re-hash
+        return prepend_zx(
+            keccak(b"\x19\x01" + self._domain_hash + order.hash_struct()).hex()
+        )
+
+
+class _CachedOrderBuilder(OrderBuilder):
+    """
+    py_clob_client's OrderBuilder builds a fresh signer (key derivation) and
+    EIP-712 domain for every order. This keeps one per exchange contract.
+    """
+
+    def __init__(self, signer, sig_type=None, funder=None):
+        super().__init__(signer, sig_type=sig_type, funder=funder)
+        self._utils_signer = UtilsSigner(key=signer.private_key)
+        self._builders: dict[bool, _DomainCachedBuilder] = {}
+
+    def _builder(self, neg_risk: bool) -> _DomainCachedBuilder:
+        builder = self._builders.get(neg_risk)
+        if builder is None:
+            chain_id = self.signer.get_chain_id()
+            builder = self._builders[neg_risk] = _DomainCachedBuilder(
+                get_contract_config(chain_id, neg_risk).exchange,
+                chain_id,
+                self._utils_signer,
+            )
+        return builder
+
+    def create_order(self, order_args: OrderArgs, options: CreateOrderOptions) -> SignedOrder:
+        side, maker_amount, taker_amount = self.get_order_amounts(
+            order_args.side,
+            order_args.size,
+            order_args.price,
+            ROUNDING_CONFIG[options.tick_size],
+        )
+        data = OrderData(
+            maker=self.funder,
+            taker=order_args.taker,
+            tokenId=order_args.token_id,
+            makerAmount=str(maker_amount),
+            takerAmount=str(taker_amount),
+            side=side,
+            feeRateBps=str(order_args.fee_rate_bps),
+            nonce=str(order_args.nonce),
+            signer=self.signer.address(),
+            expiration=str(order_args.expiration),
+            signatureType=self.sig_type,
+        )
+        return self._builder(options.neg_risk).build_signed_order(data)
+
+    def matches_upstream(self) -> bool:
+        """
+        Sign a probe order both ways and check the result is what the stock
+        py_clob_client / py_order_utils path would produce: identical order
+        fields (salt aside, it is random) and an identical signature over
+        them. Guards the create_order copy and the struct-hash override
+        against upstream changes.
+        """
+        chain_id = self.signer.get_chain_id()
+        probe = lambda: OrderArgs(token_id="1", price=0.5, size=10.0, side=BUY)
+        for neg_risk in (False, True):
+            options = CreateOrderOptions(tick_size="0.01", neg_risk=neg_risk)
+            ours = self.create_order(probe(), options)
+            theirs = super().create_order(probe(), options)
+            fields = {k: v for k, v in ours.order.values.items() if k != "salt"}
+            upstream_fields = {k: v for k, v in theirs.order.values.items() if k != "salt"}
+            if fields != upstream_fields:
+                return False
+            upstream_builder = UtilsOrderBuilder(
+                get_contract_config(chain_id, neg_risk).exchange,
+                chain_id,
+                self._utils_signer,
+            )
+            if ours.signature != upstream_builder.build_order_signature(ours.order):
+                return False
+        return True
+
+
 class PollyTrader:
     """
     Wraps the py_clob_client for Polly's use.
@@ -40,11 +162,12 @@ class PollyTrader:
     """
 
     def __init__(self):
-        self.private_key = "0x" + os.getenv("EVM_PRIVATE_KEY", "").lstrip("0x")
-        self.api_key     = os.getenv("POLYMARKET_API_KEY")
-        self.api_secret  = os.getenv("POLYMARKET_API_SECRET")
-        self.passphrase  = os.getenv("POLYMARKET_API_PASSPHRASE")
-        self.funder      = os.getenv("EVM_WALLET_ADDRESS")
+        config = _load_config()
+        self.private_key = config.private_key
+        self.api_key     = config.api_key
+        self.api_secret  = config.api_secret
+        self.passphrase  = config.passphrase
+        self.funder      = config.funder
 
         creds = ApiCreds(
             api_key=self.api_key,
@@ -59,6 +182,22 @@ class PollyTrader:
             creds=creds,
         )
 
+        # Reuse the signer + EIP-712 domain hash across orders, provided the
+        # cached path still signs exactly like upstream (this also warms both
+        # exchange builders before the first real order)
+        builder = self.client.builder
+        cached = _CachedOrderBuilder(
+            self.client.signer, sig_type=builder.sig_type, funder=builder.funder
+        )
+        if cached.matches_upstream():
+            self.client.builder = cached
+        else:
+            log.warning("Cached order builder diverges from py_clob_client; "
+                        "using the stock builder")
+
+        # Order signing is serialized; market lookups and POSTs run concurrently
+        self._sign_lock = threading.Lock()
+
         log.info(f"Trader initialized | signer: {self.client.get_address()}")
 
     def get_open_orders(self) -> list[dict]:
@@ -102,10 +241,20 @@ class PollyTrader:
                 size=round(size_usdc, 2),
                 side=clob_side,
             )
-            resp = self.client.create_and_post_order(
-                order_args,
-                options={"tick_size": str(tick_size), "neg_risk": neg_risk},
-            )
+            # Market lookups create_order needs, done before the lock so a
+            # batch overlaps them; ClobClient caches each per token, so the
+            # locked call below is local work only
+            self.client.get_tick_size(token_id)
+            self.client.get_neg_risk(token_id)
+            self.client.get_fee_rate_bps(token_id)
+            with self._sign_lock:
+                signed = self.client.create_order(
+                    order_args,
+                    options=PartialCreateOrderOptions(
+                        tick_size=str(tick_size), neg_risk=neg_risk
+                    ),
+                )
+            resp = self.client.post_order(signed)
             order_id = resp.get("orderID") if resp else None
             log.info(f"Order placed: {side} {size_usdc} USDC @ {price:.2%} | ID: {order_id}")
             return OrderResult(
@@ -130,6 +279,17 @@ class PollyTrader:
                 error=str(e),
             )
 
+    def place_orders(self, reqs: list[dict], max_workers: int = 8) -> list[OrderResult]:
+        """
+        Place several limit orders concurrently.
+        reqs: place_order() keyword arguments, one dict per order.
+        Results are returned in input order.
+        """
+        if not reqs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(reqs))) as pool:
+            return list(pool.map(lambda r: self.place_order(**r), reqs))
+
     def cancel_order(self, order_id: str) -> bool:
         try:
             self.client.cancel(order_id)